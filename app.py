@@ -1,11 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
 from datetime import datetime, timedelta, date
+from functools import lru_cache
 import calendar
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
 import pandas as pd
 
 import storage
@@ -23,6 +24,25 @@ APP_BG  = ("#F6F8FC", "#0F1422")
 TEXT_MUTED = ("#64748b", "#9aa3b2")
 
 
+@lru_cache(maxsize=None)
+def _font(size: int, weight: str = "normal") -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight); needs a Tk root, so built on first use."""
+    return ctk.CTkFont(size=size, weight=weight)
+
+
+def _chart_canvas(master, figsize: tuple[float, float]):
+    """Create a Figure, its single Axes and a Tk canvas for it.
+
+    matplotlib is imported here rather than at module level so the window
+    can appear before the (slow) import finishes.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    fig = Figure(figsize=figsize, dpi=120)
+    return fig, fig.add_subplot(111), FigureCanvasTkAgg(fig, master=master)
+
+
 class App(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -36,7 +56,8 @@ class App(ctk.CTk):
 
     
         storage.ensure_data_store(CSV_PATH)
-        self.df: pd.DataFrame = storage.load_dataframe(CSV_PATH)
+        self._load_data()
+        self._theme_pending = False
 
         
         self.grid_columnconfigure(1, weight=1)
@@ -53,19 +74,22 @@ class App(ctk.CTk):
         self.container.grid_columnconfigure(0, weight=1)
 
         
-        self.page_home = HomePage(
-            self.container,
-            get_df=lambda: self.df,
-            get_mode=self._mode,
-            on_add_task=self._home_add_task,
-            on_toggle_task=self._home_toggle_task,
-        )
-        self.page_log = LogPage(self.container, on_save=self._save_entry)
-        self.page_trends = TrendsPage(self.container, get_df=lambda: self._filtered_df(), get_mode=self._mode)
-        self.page_settings = SettingsPage(self.container, on_theme=self._toggle_theme)
-
-        for p in (self.page_home, self.page_log, self.page_trends, self.page_settings):
-            p.grid(row=0, column=0, sticky="nsew")
+        # Pages are built on first navigation and cached in self._pages.
+        self._pages: dict[str, ctk.CTkFrame] = {}
+        self._page_factories = {
+            "Home": lambda: HomePage(
+                self.container,
+                get_df=lambda: self.df,
+                get_entry_dates=lambda: self._entry_dates,
+                get_recent=lambda: self._recent,
+                get_mode=self._mode,
+                on_add_task=self._home_add_task,
+                on_toggle_task=self._home_toggle_task,
+            ),
+            "Log": lambda: LogPage(self.container, on_save=self._save_entry),
+            "Trends": lambda: TrendsPage(self.container, get_df=lambda: self._filtered_df(), get_mode=self._mode),
+            "Settings": lambda: SettingsPage(self.container, on_theme=self._toggle_theme),
+        }
 
 
         self.tasks: list[dict] = [
@@ -73,20 +97,24 @@ class App(ctk.CTk):
             {"text": "Take a short walk/breath break", "done": False},
             {"text": "Journal for 5 minutes", "done": False},
         ]
-        self._navigate("Home")
+        # Build Home (and import matplotlib) once the window has been shown.
+        self.after_idle(self._navigate, "Home")
 
 
+    def _page(self, name: str) -> ctk.CTkFrame:
+        page = self._pages.get(name)
+        if page is None:
+            page = self._pages[name] = self._page_factories[name]()
+            page.grid(row=0, column=0, sticky="nsew")
+        return page
+
     def _navigate(self, name: str):
+        page = self._page(name)
         if name == "Home":
-            self.page_home.refresh(self.df, self.tasks)
-            self.page_home.tkraise()
-        elif name == "Log":
-            self.page_log.tkraise()
+            page.refresh(self.df, self.tasks)
         elif name == "Trends":
-            self.page_trends.refresh_chart()
-            self.page_trends.tkraise()
-        elif name == "Settings":
-            self.page_settings.tkraise()
+            page.refresh_chart()
+        page.tkraise()
 
 
     def _save_entry(self, mood: int, note: str, tags: list[str]):
@@ -95,43 +123,65 @@ class App(ctk.CTk):
             return
 
         storage.append_entry(CSV_PATH, mood=mood, note=note, tags=tags)
-        self.df = storage.load_dataframe(CSV_PATH)
-        self.page_log.clear_after_save()
+        self._load_data()
+        self._page("Log").clear_after_save()
 
 
         today = date.today()
-        self.page_home.selected_date = today
-        self.page_home.refresh(self.df, self.tasks)
-        self.page_home._on_date_click(today)
+        home = self._page("Home")
+        home.selected_date = today
+        home.refresh(self.df, self.tasks)
+        home._on_date_click(today)
 
         self._navigate("Home")
 
+    def _load_data(self):
+        """Reload the CSV and rebuild the lookups derived from it."""
+        self.df: pd.DataFrame = storage.load_dataframe(CSV_PATH)
+        if self.df.empty:
+            self._entry_dates: set[date] = set()
+            self._recent: pd.DataFrame = self.df
+        else:
+            self._entry_dates = set(self.df["date"].tolist())
+            self._recent = self.df.nlargest(4, "timestamp")
+
     def _filtered_df(self) -> pd.DataFrame:
         if self.df.empty:
             return self.df
-        rng = getattr(self.page_trends, "range_var", tk.StringVar(value="Last 30 days")).get()
+        rng = getattr(self._pages.get("Trends"), "range_var", tk.StringVar(value="Last 30 days")).get()
         if rng == "All time":
             return self.df
         days = 7 if "7" in rng else 30
         cutoff = datetime.now() - timedelta(days=days)
-        return self.df[self.df["timestamp"] >= cutoff]
+        # load_dataframe sorts by timestamp, so the window is a tail slice
+        start = self.df["timestamp"].to_numpy().searchsorted(np.datetime64(cutoff))
+        return self.df.iloc[start:]
 
     def _home_add_task(self, text: str):
         if text.strip():
             self.tasks.insert(0, {"text": text.strip(), "done": False})
-            self.page_home.refresh(self.df, self.tasks)
+            self._page("Home").refresh_tasks(self.tasks)
 
     def _home_toggle_task(self, idx: int, val: bool):
         if 0 <= idx < len(self.tasks):
             self.tasks[idx]["done"] = val
-            self.page_home.refresh(self.df, self.tasks)
+            self._page("Home").refresh_tasks(self.tasks)
 
 
     def _toggle_theme(self, mode: str):
         ctk.set_appearance_mode(mode)
         self.configure(fg_color=APP_BG)
-        self.page_trends.refresh_chart()
-        self.page_home.refresh(self.df, self.tasks)
+        # Let the theme repaint finish first; rapid toggles share one redraw.
+        if not self._theme_pending:
+            self._theme_pending = True
+            self.after_idle(self._redraw_themed_charts)
+
+    def _redraw_themed_charts(self):
+        self._theme_pending = False
+        if "Trends" in self._pages:
+            self._pages["Trends"].refresh_chart()
+        if "Home" in self._pages:
+            self._pages["Home"].refresh(self.df, self.tasks)
 
     def _mode(self) -> str:
         return "dark" if ctk.get_appearance_mode().lower() == "dark" else "light"
@@ -143,7 +193,7 @@ class Sidebar(ctk.CTkFrame):
         super().__init__(master, width=220, corner_radius=0, fg_color="transparent")
         self.command = command
 
-        title = ctk.CTkLabel(self, text=APP_TITLE, font=ctk.CTkFont(size=22, weight="bold"))
+        title = ctk.CTkLabel(self, text=APP_TITLE, font=_font(22, "bold"))
         title.pack(padx=18, pady=(18, 8), anchor="w")
 
         ctk.CTkLabel(self, text="Navigate", text_color=TEXT_MUTED).pack(padx=18, anchor="w")
@@ -178,12 +228,15 @@ class Card(ctk.CTkFrame):
 
 
 class HomePage(ctk.CTkFrame):
-    def __init__(self, master, get_df, get_mode, on_add_task, on_toggle_task):
+    def __init__(self, master, get_df, get_entry_dates, get_recent, get_mode, on_add_task, on_toggle_task):
         super().__init__(master, fg_color="transparent")
         self.get_df = get_df
+        self.get_entry_dates = get_entry_dates
+        self.get_recent = get_recent
         self.get_mode = get_mode
         self.on_add_task = on_add_task
         self.on_toggle_task = on_toggle_task
+        self.tasks: list[dict] = []
 
         today = date.today()
         self.cal_year = today.year
@@ -196,7 +249,7 @@ class HomePage(ctk.CTkFrame):
 
         header = ctk.CTkFrame(self, fg_color="transparent")
         header.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(4, 0))
-        ctk.CTkLabel(header, text="Hi, there 👋", font=ctk.CTkFont(size=20, weight="bold")).pack(side="left", padx=(4, 10))
+        ctk.CTkLabel(header, text="Hi, there 👋", font=_font(20, "bold")).pack(side="left", padx=(4, 10))
         self.search = ctk.CTkEntry(header, placeholder_text="Search entries…", width=280)
         self.search.pack(side="left")
 
@@ -204,17 +257,22 @@ class HomePage(ctk.CTkFrame):
         self.tracker_card.grid(row=1, column=0, sticky="nsew", padx=(0, 10), pady=(10, 8))
         title_row = ctk.CTkFrame(self.tracker_card.pad, fg_color="transparent")
         title_row.pack(fill="x")
-        ctk.CTkLabel(title_row, text="Weekly Mood Tracker", font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        ctk.CTkLabel(title_row, text="Weekly Mood Tracker", font=_font(16, "bold")).pack(side="left")
         self.week_label = ctk.CTkLabel(title_row, text="", text_color=TEXT_MUTED)
         self.week_label.pack(side="right")
 
-        self.week_canvas = None 
+        self.week_fig, self.week_ax, self.week_canvas = _chart_canvas(self.tracker_card.pad, (9.5, 3.8))
+        self.week_canvas.get_tk_widget().pack(fill="both", expand=True, pady=(6, 0))
+        self.week_bars = None
+        self._week_mode: str | None = None
+        self._week_df: pd.DataFrame | None = None
+        self._week_start: date | None = None
 
         self.recent_card = Card(self)
         self.recent_card.grid(row=2, column=0, sticky="nsew", padx=(0, 10), pady=(8, 10))
         head = ctk.CTkFrame(self.recent_card.pad, fg_color="transparent")
         head.pack(fill="x")
-        ctk.CTkLabel(head, text="Recent Entries", font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        ctk.CTkLabel(head, text="Recent Entries", font=_font(16, "bold")).pack(side="left")
         self.recent_grid = ctk.CTkFrame(self.recent_card.pad, fg_color="transparent")
         self.recent_grid.pack(fill="both", expand=True, pady=(6, 0))
 
@@ -223,20 +281,42 @@ class HomePage(ctk.CTkFrame):
         self.calendar_card.grid(row=1, column=1, sticky="nsew", pady=(10, 8))
         cal_header = ctk.CTkFrame(self.calendar_card.pad, fg_color="transparent")
         cal_header.pack(fill="x")
-        self.month_label = ctk.CTkLabel(cal_header, text="", font=ctk.CTkFont(size=16, weight="bold"))
+        self.month_label = ctk.CTkLabel(cal_header, text="", font=_font(16, "bold"))
         self.month_label.pack(side="left")
         ctk.CTkButton(cal_header, text="◀", width=32, command=self._prev_month).pack(side="right")
         ctk.CTkButton(cal_header, text="▶", width=32, command=self._next_month).pack(side="right")
         self.calendar_grid = ctk.CTkFrame(self.calendar_card.pad, fg_color="transparent")
         self.calendar_grid.pack(fill="x", pady=(6, 0))
 
+        for i, h in enumerate(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]):
+            ctk.CTkLabel(self.calendar_grid, text=h, text_color=TEXT_MUTED).grid(row=0, column=i, padx=6, pady=4)
+            self.calendar_grid.grid_columnconfigure(i, weight=1)
+
+        # A month spans at most 6 weeks; build the buttons once and reconfigure them.
+        self._day_buttons: list[list[ctk.CTkButton]] = []
+        for r in range(6):
+            row = []
+            for c in range(7):
+                b = ctk.CTkButton(
+                    self.calendar_grid,
+                    text="",
+                    width=40, height=36,
+                    corner_radius=10,
+                    hover_color=("#dce6fa", "#222b42"),
+                )
+                b.grid(row=r + 1, column=c, padx=4, pady=4, sticky="nsew")
+                row.append(b)
+            self._day_buttons.append(row)
+
 
         self.day_card = Card(self)
         self.day_card.grid(row=2, column=1, sticky="nsew", pady=(8, 10))
-        self.day_title = ctk.CTkLabel(self.day_card.pad, text="Entries for —", font=ctk.CTkFont(size=16, weight="bold"))
+        self.day_title = ctk.CTkLabel(self.day_card.pad, text="Entries for —", font=_font(16, "bold"))
         self.day_title.pack(anchor="w")
         self.day_list = ctk.CTkScrollableFrame(self.day_card.pad, height=220, fg_color="transparent")
         self.day_list.pack(fill="both", expand=True, pady=(6, 0))
+        self.day_empty = ctk.CTkLabel(self.day_list, text="No entries.", text_color=TEXT_MUTED)
+        self._day_labels: list[ctk.CTkLabel] = []
 
 
     def _prev_month(self):
@@ -247,7 +327,7 @@ class HomePage(ctk.CTkFrame):
             self.cal_month -= 1
         if self.selected_date and (self.selected_date.year != self.cal_year or self.selected_date.month != self.cal_month):
             self.selected_date = None
-        self._build_calendar(self.get_df())
+        self._build_calendar(self.get_entry_dates())
 
     def _next_month(self):
         if self.cal_month == 12:
@@ -257,129 +337,118 @@ class HomePage(ctk.CTkFrame):
             self.cal_month += 1
         if self.selected_date and (self.selected_date.year != self.cal_year or self.selected_date.month != self.cal_month):
             self.selected_date = None
-        self._build_calendar(self.get_df())
-
-    def _build_calendar(self, df: pd.DataFrame):
-        for w in self.calendar_grid.winfo_children():
-            w.destroy()
+        self._build_calendar(self.get_entry_dates())
 
+    def _build_calendar(self, entry_dates: set[date]):
         self.month_label.configure(text=f"{calendar.month_name[self.cal_month]} {self.cal_year}")
 
-        headers = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for i, h in enumerate(headers):
-            ctk.CTkLabel(self.calendar_grid, text=h, text_color=TEXT_MUTED).grid(row=0, column=i, padx=6, pady=4)
-
         cal = calendar.Calendar(firstweekday=0).monthdatescalendar(self.cal_year, self.cal_month)
 
-        entry_dates = set()
-        if df is not None and not df.empty:
-            d = df.copy()
-            d["date"] = pd.to_datetime(d["timestamp"], errors="coerce").dt.date
-            entry_dates = set(d.dropna(subset=["date"])["date"].tolist())
-
-        for r, week in enumerate(cal, start=1):
-            for c, day in enumerate(week):
+        for r, row in enumerate(self._day_buttons):
+            if r >= len(cal):
+                for b in row:
+                    b.grid_remove()
+                continue
+            for b, day in zip(row, cal[r]):
                 in_month = (day.month == self.cal_month)
                 has_entries = day in entry_dates
 
                 txt_color = ("#94a3b8", "#8a93a3") if not in_month else ("#0f172a", "#E6E9F2")
-                btn_fg = (None if not has_entries else ACCENT)
 
-                b = ctk.CTkButton(
-                    self.calendar_grid,
+                b.configure(
                     text=str(day.day),
-                    width=40, height=36,
-                    corner_radius=10,
-                    fg_color=btn_fg if has_entries else ("#e7eef9", "#1E2536"),
-                    hover_color=("#dce6fa", "#222b42"),
+                    fg_color=ACCENT if has_entries else ("#e7eef9", "#1E2536"),
                     text_color=txt_color,
                     command=lambda d=day: self._on_date_click(d),
                 )
-                b.grid(row=r, column=c, padx=4, pady=4, sticky="nsew")
+                b.grid()
+
+    def _show_day_lines(self, lines: list[str]):
+        """Show ``lines`` in the day panel, reusing pooled labels."""
+        if not lines:
+            for lbl in self._day_labels:
+                lbl.pack_forget()
+            self.day_empty.pack(anchor="w", padx=6, pady=4)
+            return
 
-        for i in range(7):
-            self.calendar_grid.grid_columnconfigure(i, weight=1)
+        self.day_empty.pack_forget()
+        while len(self._day_labels) < len(lines):
+            self._day_labels.append(ctk.CTkLabel(self.day_list, text="", wraplength=420, justify="left"))
+        for i, lbl in enumerate(self._day_labels):
+            if i < len(lines):
+                lbl.configure(text=lines[i])
+                lbl.pack(anchor="w", padx=6, pady=3)
+            else:
+                lbl.pack_forget()
 
     def _on_date_click(self, d: date):
         self.selected_date = d
         self.day_title.configure(text=f"Entries for {d:%b %d, %Y}")
-        for w in self.day_list.winfo_children():
-            w.destroy()
 
         df = self.get_df()
         if df is None or df.empty:
-            ctk.CTkLabel(self.day_list, text="No entries.", text_color=TEXT_MUTED).pack(anchor="w", padx=6, pady=4)
+            self._show_day_lines([])
             return
 
-        dd = df.copy()
-        dd["date"] = pd.to_datetime(dd["timestamp"], errors="coerce").dt.date
-        dd = dd[dd["date"] == d].sort_values("timestamp", ascending=False)
-
-        if dd.empty:
-            ctk.CTkLabel(self.day_list, text="No entries.", text_color=TEXT_MUTED).pack(anchor="w", padx=6, pady=4)
-            return
+        dd = df.loc[df["date"] == d].sort_values("timestamp", ascending=False)
 
-        for _, row in dd.iterrows():
-            ts = pd.to_datetime(row["timestamp"], errors="coerce")
-            ttxt = "Unknown" if pd.isna(ts) else ts.strftime("%I:%M %p").lstrip("0")
-            mood = int(row.get("mood", 0)) if pd.notna(row.get("mood", None)) else 0
-            note = (row.get("note") or "").strip() or "(no note)"
-            line = f"[{ttxt}]  Mood {mood} — {note}"
-            ctk.CTkLabel(self.day_list, text=line, wraplength=420, justify="left").pack(anchor="w", padx=6, pady=3)
+        ts_text = dd["timestamp"].dt.strftime("%I:%M %p").str.lstrip("0")
+        note_text = dd["note"].str.strip().replace("", "(no note)")
+        moods = dd["mood"]
+        self._show_day_lines([
+            f"[{ttxt}]  Mood {mood} — {note}"
+            for ttxt, mood, note in zip(ts_text.to_numpy(), moods.to_numpy(), note_text.to_numpy())
+        ])
 
     def refresh(self, df: pd.DataFrame, tasks: list[dict]):
- 
+        self.refresh_mood(df)
+        self.refresh_tasks(tasks)
+
+    def refresh_tasks(self, tasks: list[dict]):
+        """Task changes never touch the chart, calendar or recent entries."""
+        self.tasks = tasks
+
+    def refresh_mood(self, df: pd.DataFrame):
         mode = self.get_mode()
         week_start = (date.today() - timedelta(days=date.today().weekday()))
         week_end = week_start + timedelta(days=6)
         self.week_label.configure(text=f"{week_start:%b %d} – {week_end:%b %d}")
-        fig = charts.weekly_mood_bar(df, mode=mode)
-
-
-        new_canvas = None
-        if fig is not None:
-            new_canvas = FigureCanvasTkAgg(fig, master=self.tracker_card.pad)
-            new_canvas.draw()
-            new_canvas.get_tk_widget().pack(fill="both", expand=True, pady=(6, 0))
-
-        old = self.week_canvas
-        self.week_canvas = new_canvas
-        if old is not None and old.get_tk_widget().winfo_exists():
-            self.after(0, old.get_tk_widget().destroy)
+        # The Tk canvas keeps its last render, so only redraw when the
+        # theme, the data (a new frame is loaded on save) or the week changed.
+        if self.week_bars is None or self._week_mode != mode:
+            self.week_ax.clear()
+            self.week_bars = charts.weekly_mood_bar(df, self.week_ax, mode=mode)
+            self.week_canvas.draw_idle()
+        elif df is not self._week_df or week_start != self._week_start:
+            charts.update_weekly_bars(self.week_bars, df, self.week_ax)
+            self.week_canvas.draw_idle()
+        self._week_mode, self._week_df, self._week_start = mode, df, week_start
 
 
         for w in self.recent_grid.winfo_children():
             w.destroy()
 
-        if df is None or df.empty:
-            recent = pd.DataFrame()
-        else:
-            recent = df.copy()
-            recent["timestamp"] = pd.to_datetime(recent["timestamp"], errors="coerce")
-            recent = recent.dropna(subset=["timestamp"]).sort_values("timestamp", ascending=False).head(4)
-
+        recent = self.get_recent()
         if recent.empty:
             ctk.CTkLabel(self.recent_grid, text="No entries yet.", text_color=TEXT_MUTED).pack(anchor="w")
         else:
             cols = 2
-            for i, row in recent.reset_index(drop=True).iterrows():
+            ts_texts = recent["timestamp"].dt.strftime("%a  %I:%M %p").to_numpy()
+            notes = recent["note"].str.strip().replace("", "(no note)").to_numpy()
+            for i, (ts_text, note) in enumerate(zip(ts_texts, notes)):
                 card = ctk.CTkFrame(self.recent_grid, corner_radius=12, fg_color=CARD_BG)
                 r, c = divmod(i, cols)
                 card.grid(row=r, column=c, sticky="nsew", padx=6, pady=6)
                 for col in range(cols):
                     self.recent_grid.grid_columnconfigure(col, weight=1)
 
-                ts = pd.to_datetime(row["timestamp"], errors="coerce")
-                ts_text = "Unknown time" if pd.isna(ts) else ts.strftime("%a  %I:%M %p").lstrip("0")
-
                 header = ctk.CTkLabel(card, text=ts_text, text_color=TEXT_MUTED)
                 header.pack(anchor="w", padx=12, pady=(10, 0))
 
-                note = (row.get("note") or "").strip() or "(no note)"
                 body = ctk.CTkLabel(card, text=note, wraplength=360, justify="left")
                 body.pack(anchor="w", padx=12, pady=(6, 12))
 
-        self._build_calendar(df)
+        self._build_calendar(self.get_entry_dates())
         if self.selected_date:
             self._on_date_click(self.selected_date)
 
@@ -393,12 +462,12 @@ class LogPage(ctk.CTkFrame):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
-        header = ctk.CTkLabel(self, text="Log your mood", font=ctk.CTkFont(size=20, weight="bold"))
+        header = ctk.CTkLabel(self, text="Log your mood", font=_font(20, "bold"))
         header.grid(row=0, column=0, columnspan=2, sticky="w", padx=6, pady=(10, 0))
 
         left = Card(self)
         left.grid(row=1, column=0, sticky="nsew", padx=(0, 10), pady=10)
-        ctk.CTkLabel(left.pad, text="How are you feeling?", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(left.pad, text="How are you feeling?", font=_font(14, "bold")).pack(anchor="w")
         ctk.CTkLabel(left.pad, text="Drag the slider: 1 (low) → 5 (great).", text_color=TEXT_MUTED).pack(anchor="w", pady=(0, 8))
 
         self.mood_var = tk.DoubleVar(value=3.0)
@@ -412,21 +481,21 @@ class LogPage(ctk.CTkFrame):
 
         preview = ctk.CTkFrame(left.pad, fg_color="transparent")
         preview.pack(anchor="w", pady=4)
-        self.emoji = ctk.CTkLabel(preview, text="😐", font=ctk.CTkFont(size=32))
+        self.emoji = ctk.CTkLabel(preview, text="😐", font=_font(32))
         self.emoji.pack(side="left")
-        self.value_lbl = ctk.CTkLabel(preview, text="3", font=ctk.CTkFont(size=18, weight="bold"))
+        self.value_lbl = ctk.CTkLabel(preview, text="3", font=_font(18, "bold"))
         self.value_lbl.pack(side="left", padx=8)
 
         right = Card(self)
         right.grid(row=1, column=1, sticky="nsew", padx=(10, 0), pady=10)
-        ctk.CTkLabel(right.pad, text="Add a note (optional)", font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(right.pad, text="Add a note (optional)", font=_font(14, "bold")).pack(anchor="w")
         self.note = ctk.CTkTextbox(right.pad, height=230)
         self.note.pack(fill="both", expand=True, pady=(8, 10))
 
         tag_bar = ctk.CTkFrame(right.pad, fg_color="transparent")
         tag_bar.pack(anchor="w", pady=(4, 0))
         ctk.CTkLabel(tag_bar, text="Tags:", text_color=TEXT_MUTED).pack(side="left", padx=(0, 8))
-        self.tags = ["sleep", "study", "work", "family", "friends", "exercise"]
+        self.tags = list(storage.TAG_BITS)
         self.tag_vars: dict[str, tk.BooleanVar] = {}
         for t in self.tags:
             var = tk.BooleanVar()
@@ -473,7 +542,7 @@ class TrendsPage(ctk.CTkFrame):
 
         top = ctk.CTkFrame(self, fg_color="transparent")
         top.pack(fill="x")
-        ctk.CTkLabel(top, text="Trends", font=ctk.CTkFont(size=20, weight="bold")).pack(side="left", padx=(4, 10))
+        ctk.CTkLabel(top, text="Trends", font=_font(20, "bold")).pack(side="left", padx=(4, 10))
         self.range_var = tk.StringVar(value="Last 30 days")
         self.range_dd = ctk.CTkOptionMenu(
             top,
@@ -489,7 +558,10 @@ class TrendsPage(ctk.CTkFrame):
 
         self.card = Card(self)
         self.card.pack(fill="both", expand=True, pady=(10, 0))
-        self.canvas_widget = None
+        self.fig, self.ax, self.canvas_widget = _chart_canvas(self.card.pad, (8.8, 4.8))
+        self.canvas_widget.get_tk_widget().pack(fill="both", expand=True)
+        self.line = None
+        self._line_mode: str | None = None
 
     def refresh_chart(self):
         df = self.get_df()
@@ -500,18 +572,15 @@ class TrendsPage(ctk.CTkFrame):
         self.stats.configure(text=avg)
 
         mode = self.get_mode()
-        fig = charts.mood_line_chart(df, mode=mode)
-
-        new_canvas = None
-        if fig is not None:
-            new_canvas = FigureCanvasTkAgg(fig, master=self.card.pad)
-            new_canvas.draw()
-            new_canvas.get_tk_widget().pack(fill="both", expand=True)
-
-        old = self.canvas_widget
-        self.canvas_widget = new_canvas
-        if old is not None and old.get_tk_widget().winfo_exists():
-            self.after(0, old.get_tk_widget().destroy)
+        # An empty range rebuilds the axes (and drops the line) so no stale
+        # date axis from the previous range is left behind.
+        if self.line is None or self._line_mode != mode or df.empty:
+            self.ax.clear()
+            self.line = charts.mood_line_chart(df, self.ax, mode=mode)
+            self._line_mode = mode
+        else:
+            charts.update_mood_line(self.line, df, self.ax)
+        self.canvas_widget.draw_idle()
 
 
 class SettingsPage(ctk.CTkFrame):
@@ -520,7 +589,7 @@ class SettingsPage(ctk.CTkFrame):
         self.on_theme = on_theme
         card = Card(self)
         card.pack(fill="x", pady=10)
-        ctk.CTkLabel(card.pad, text="Appearance", font=ctk.CTkFont(size=16, weight="bold")).pack(anchor="w")
+        ctk.CTkLabel(card.pad, text="Appearance", font=_font(16, "bold")).pack(anchor="w")
         ctk.CTkLabel(card.pad, text="Choose light or dark theme.", text_color=TEXT_MUTED).pack(anchor="w", pady=(0, 6))
         row = ctk.CTkFrame(card.pad, fg_color="transparent")
         row.pack(anchor="w")
@@ -1,25 +1,28 @@
 from __future__ import annotations
+from typing import TYPE_CHECKING
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
 from datetime import datetime, timedelta, date
 import numpy as np
 
-
-def _palette(mode: str):
-    if str(mode).lower() == "light":
-        return {
-            "fig": "#ffffff",
-            "axes": "#ffffff",
-            "grid": (0, 0, 0, 0.10),
-            "label": "#0f172a",
-            "line": "#7C5CFF",
-            "happy": "#16a34a",
-            "neutral": "#475569",
-            "sad": "#e11d48",
-            "markeredge": "#ffffff",
-        }
-    return {
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.container import BarContainer
+    from matplotlib.lines import Line2D
+
+
+_PALETTES = {
+    "light": {
+        "fig": "#ffffff",
+        "axes": "#ffffff",
+        "grid": (0, 0, 0, 0.10),
+        "label": "#0f172a",
+        "line": "#7C5CFF",
+        "happy": "#16a34a",
+        "neutral": "#475569",
+        "sad": "#e11d48",
+        "markeredge": "#ffffff",
+    },
+    "dark": {
         "fig": "#0f1422",
         "axes": "#151B2B",
         "grid": (1, 1, 1, 0.18),
@@ -29,24 +32,41 @@ def _palette(mode: str):
         "neutral": "#94a3b8",
         "sad": "#fb7185",
         "markeredge": "#0f1422",
-    }
+    },
+}
 
 
-def mood_line_chart(df: pd.DataFrame, mode: str = "dark") -> Figure | None:
-    if df is None or df.empty:
-        return None
-    tmp = df.copy()
-    tmp["timestamp"] = pd.to_datetime(tmp["timestamp"], errors="coerce")
-    tmp = tmp.dropna(subset=["timestamp"]).sort_values("timestamp")
-    P = _palette(mode)
+# Bar positions for the fixed Mon–Sun grid of the weekly chart
+_BAR_X = np.arange(7)
+_BAR_W = 0.25
+_BAR_LEFT = _BAR_X - _BAR_W
+_BAR_RIGHT = _BAR_X + _BAR_W
+
+
+def _palette(mode: str):
+    return _PALETTES.get(str(mode).lower(), _PALETTES["dark"])
+
 
-    fig = plt.Figure(figsize=(8.8, 4.8), dpi=120)
+def _line_data(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    # load_dataframe already drops NaT and sorts by timestamp
+    return df["timestamp"], df["mood"]
+
+
+def mood_line_chart(df: pd.DataFrame, ax: Axes, mode: str = "dark") -> Line2D | None:
+    """
+    Plot mood over time into an existing (cleared) axes. Returns the line so
+    later refreshes can go through update_mood_line, or None if there was
+    nothing to plot.
+    """
+    P = _palette(mode)
+    fig = ax.figure
     fig.patch.set_facecolor(P["fig"])
-    ax = fig.add_subplot(111)
     ax.set_facecolor(P["axes"])
 
-    ax.plot(tmp["timestamp"], tmp["mood"], marker="o", linewidth=2.4, color=P["line"],
-            markerfacecolor=P["line"], markeredgecolor=P["markeredge"])
+    line = None
+    if df is not None and not df.empty:
+        (line,) = ax.plot(*_line_data(df), marker="o", linewidth=2.4, color=P["line"],
+                          markerfacecolor=P["line"], markeredgecolor=P["markeredge"])
     ax.set_ylim(0.8, 5.2)
     ax.set_yticks([1, 2, 3, 4, 5])
     ax.set_ylabel("Mood (1–5)", color=P["label"])
@@ -57,65 +77,67 @@ def mood_line_chart(df: pd.DataFrame, mode: str = "dark") -> Figure | None:
     ax.grid(True, linestyle=":", color=P["grid"])
     fig.autofmt_xdate()
     fig.tight_layout()
-    return fig
+    return line
 
 
-def weekly_mood_bar(df: pd.DataFrame, mode: str = "dark") -> Figure | None:
-    """
-    Grouped bars by weekday for the current week (Mon–Sun).
-    Bins: Happy (4–5), Neutral (3), Sad (1–2).
-    """
-    P = _palette(mode)
-    today: date = date.today()
-    start = today - timedelta(days=today.weekday())   
-    end = start + timedelta(days=6)                   
-
-    wk = [start + timedelta(days=i) for i in range(7)]
-    x = np.arange(7)
-    width = 0.25
+def update_mood_line(line: Line2D, df: pd.DataFrame, ax: Axes) -> None:
+    """Swap the data on the line returned by mood_line_chart; ``df`` must not be empty."""
+    line.set_data(*_line_data(df))
+    ax.relim()
+    ax.autoscale_view(scaley=False)
 
-    fig = plt.Figure(figsize=(9.5, 3.8), dpi=120)
-    fig.patch.set_facecolor(P["fig"])
-    ax = fig.add_subplot(111)
-    ax.set_facecolor(P["axes"])
 
-    if df is None or df.empty:
-        counts = {"Happy": [0]*7, "Neutral": [0]*7, "Sad": [0]*7}
-    else:
-        tmp = df.copy()
-        tmp["timestamp"] = pd.to_datetime(tmp["timestamp"], errors="coerce")
-        tmp = tmp.dropna(subset=["timestamp"])
-        tmp["date"] = tmp["timestamp"].dt.date
+def _current_week() -> list[date]:
+    today: date = date.today()
+    start = today - timedelta(days=today.weekday())
+    return [start + timedelta(days=i) for i in range(7)]
 
 
-        tmp = tmp[(tmp["timestamp"] >= pd.Timestamp(start)) &
-              (tmp["timestamp"] <= pd.Timestamp(end) + pd.Timedelta(days=1))]
+def weekly_mood_counts(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Per-weekday entry counts for the current week (Mon–Sun).
+    Bins: Happy (4–5), Neutral (3), Sad (1–2).
+    """
+    wk = _current_week()
+    if df is None or df.empty:
+        return {k: np.zeros(7, dtype=int) for k in ("Happy", "Neutral", "Sad")}
 
-        tmp["mood"] = pd.to_numeric(tmp["mood"], errors="coerce").fillna(3).astype(int)
+    start = pd.Timestamp(wk[0])
+    # load_dataframe sorts by timestamp, so the week is a slice found by bisection
+    lo, hi = df["timestamp"].to_numpy().searchsorted(
+        [start.to_datetime64(), (start + pd.Timedelta(days=7)).to_datetime64()]
+    )
+    tmp = df.iloc[lo:hi]
 
+    # One pass: weekday index (0–6) × bin (0 Happy, 1 Neutral, 2 Sad) → bincount
+    day_idx = (tmp["timestamp"] - start).dt.days.to_numpy()
+    mood = tmp["mood"].to_numpy()
+    bin_idx = (mood < 3) * 2 + (mood == 3)
+    grid = np.bincount(day_idx * 3 + bin_idx, minlength=21).reshape(7, 3)
+    return {"Happy": grid[:, 0], "Neutral": grid[:, 1], "Sad": grid[:, 2]}
 
-        # Bin
-        def mood_bin(m: int) -> str:
-            if m <= 2:
-                return "Sad"
-            if m == 3:
-                return "Neutral"
-            return "Happy"
 
-        tmp["bin"] = tmp["mood"].map(mood_bin)
+def weekly_mood_bar(df: pd.DataFrame, ax: Axes, mode: str = "dark") -> dict[str, BarContainer]:
+    """
+    Grouped bars by weekday for the current week (Mon–Sun), drawn into an
+    existing (cleared) axes. Returns the bar containers so later refreshes
+    can go through update_weekly_bars instead of redrawing the axes.
+    """
+    P = _palette(mode)
+    wk = _current_week()
 
-        counts = {"Happy": [], "Neutral": [], "Sad": []}
-        for day in wk:
-            day_df = tmp[tmp["date"] == day]
-            counts["Happy"].append(int((day_df["bin"] == "Happy").sum()))
-            counts["Neutral"].append(int((day_df["bin"] == "Neutral").sum()))
-            counts["Sad"].append(int((day_df["bin"] == "Sad").sum()))
+    fig = ax.figure
+    fig.patch.set_facecolor(P["fig"])
+    ax.set_facecolor(P["axes"])
 
-    ax.bar(x - width, counts["Happy"], width, label="Happy", color=P["happy"])
-    ax.bar(x,         counts["Neutral"], width, label="Neutral", color=P["neutral"])
-    ax.bar(x + width, counts["Sad"], width, label="Sad", color=P["sad"])
+    counts = weekly_mood_counts(df)
+    bars = {
+        "Happy": ax.bar(_BAR_LEFT, counts["Happy"], _BAR_W, label="Happy", color=P["happy"]),
+        "Neutral": ax.bar(_BAR_X, counts["Neutral"], _BAR_W, label="Neutral", color=P["neutral"]),
+        "Sad": ax.bar(_BAR_RIGHT, counts["Sad"], _BAR_W, label="Sad", color=P["sad"]),
+    }
 
-    ax.set_xticks(x)
+    ax.set_xticks(_BAR_X)
     ax.set_xticklabels([d.strftime("%a") for d in wk], color=P["label"])
     ax.set_ylabel("Count", color=P["label"])
     ax.set_title("Your Week", color=P["label"])
@@ -125,4 +147,14 @@ def weekly_mood_bar(df: pd.DataFrame, mode: str = "dark") -> Figure | None:
     ax.grid(True, linestyle=":", axis="y", color=P["grid"])
     ax.legend(frameon=False, labelcolor=P["label"])
     fig.tight_layout()
-    return fig
+    return bars
+
+
+def update_weekly_bars(bars: dict[str, BarContainer], df: pd.DataFrame, ax: Axes) -> None:
+    """Set new heights on the bars returned by weekly_mood_bar."""
+    counts = weekly_mood_counts(df)
+    for k, container in bars.items():
+        for rect, h in zip(container, counts[k]):
+            rect.set_height(h)
+    ax.relim()
+    ax.autoscale_view(scalex=False)
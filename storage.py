@@ -3,52 +3,121 @@ storage.py — CSV data layer (robust timestamp parsing)
 """
 from __future__ import annotations
 from pathlib import Path
-from datetime import datetime
-import pandas as pd
+from typing import TYPE_CHECKING
+import csv
 import json
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 COLUMNS = ["timestamp", "mood", "note", "tags"]
 
+# One bit per known tag, so tag filters are a vectorized AND on ``tag_mask``:
+#   df[(df["tag_mask"] & TAG_BITS["sleep"]) != 0]
+TAG_BITS = {"sleep": 1, "study": 2, "work": 4, "family": 8, "friends": 16, "exercise": 32}
+
+# Parsed frames keyed by path, valid while (st_mtime_ns, st_size) match the file.
+_CACHE: dict[Path, tuple[int, int, pd.DataFrame]] = {}
+
 
 def ensure_data_store(csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
     if not csv_path.exists():
-        pd.DataFrame(columns=COLUMNS).to_csv(csv_path, index=False)
+        with csv_path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerow(COLUMNS)
 
 
 def load_dataframe(csv_path: Path) -> pd.DataFrame:
     ensure_data_store(csv_path)
-    df = pd.read_csv(csv_path)
-    if df.empty:
-        return df
+    st = csv_path.stat()
+    cached = _CACHE.get(csv_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2].copy(deep=False)
+
+    df = _parse_csv(csv_path)
+    _CACHE[csv_path] = (st.st_mtime_ns, st.st_size, df)
+    return df.copy(deep=False)
 
-    df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
 
-    df["mood"] = pd.to_numeric(df.get("mood"), errors="coerce")
+def _parse_csv(csv_path: Path) -> pd.DataFrame:
+    # pandas is only needed for reads; appending an entry stays on the stdlib
+    import pandas as pd
 
-    def parse_tags(x):
-        if pd.isna(x) or x == "":
-            return []
+    df = pd.read_csv(
+        csv_path,
+        dtype={"note": "string", "tags": "string"},
+        parse_dates=["timestamp"],
+        date_format="ISO8601",
+    )
+
+    # parse_dates leaves the column as object if any value is malformed
+    if not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", errors="coerce")
+    # Rows without a usable timestamp are dropped from the frame so callers
+    # never see NaT; they stay in the CSV, since append_entry never rewrites it
+    df = df.dropna(subset=["timestamp"])
+    # Second resolution is all the CSV carries
+    df["timestamp"] = df["timestamp"].astype("datetime64[s]")
+    # mood is coerced rather than typed in read_csv so a hand-edited bad cell
+    # becomes NaN instead of failing the load; blank/bad moods count as neutral
+    df["mood"] = pd.to_numeric(df["mood"], errors="coerce").fillna(3).astype("int8")
+    df = df.sort_values("timestamp", ignore_index=True)
+    df["date"] = df["timestamp"].dt.date
+
+    df["note"] = df["note"].fillna("")
+
+    raw_tags = df.get("tags", pd.Series([], dtype="string")).fillna("").astype(str).str.strip()
+    is_list = raw_tags.str.startswith("[")
+    df["tags"] = _parse_tags(raw_tags, is_list)
+    df["tag_mask"] = _tag_mask(raw_tags, is_list)
+    return df
+
+
+def _parse_tags(s: pd.Series, is_list: pd.Series) -> pd.Series:
+    """
+    Tags are stored as a JSON array (older rows may be ';'-separated).
+    ``s`` is the stripped raw tag text and ``is_list`` marks rows starting
+    with '['. Plain string items are pulled out with vectorized regex passes;
+    only the rare rows with escapes or single quotes go through json.loads.
+    """
+    tags = s.str.findall(r'"([^"\\]*)"')
+
+    legacy = ~is_list
+    tags[legacy] = s[legacy].str.replace(r"\s*;\s*", ";", regex=True).str.findall(r"[^;]+")
+
+    def loads(x: str) -> list[str]:
         try:
             return json.loads(x)
         except Exception:
-            return [t.strip() for t in str(x).split(";") if t.strip()]
+            return [t.strip() for t in x.split(";") if t.strip()]
 
-    df["tags"] = df.get("tags", pd.Series([], dtype="object")).apply(parse_tags)
-    return df
+    escaped = is_list & s.str.contains(r"[\\']", regex=True)
+    tags[escaped] = s[escaped].map(loads)
+    return tags
+
+
+def _tag_mask(s: pd.Series, is_list: pd.Series) -> pd.Series:
+    """
+    TAG_BITS mask per row, built from the raw tag strings (same inputs as
+    _parse_tags) with one vectorized pass per known tag.
+    """
+    mask = 0
+    for tag, bit in TAG_BITS.items():
+        # Either quote: older saves rewrote tags as Python reprs, e.g.
+        # ['work'], sometimes double-encoded as ["['work']"]
+        in_list = s.str.contains(rf"[\"']{tag}[\"']", regex=True)
+        in_legacy = s.str.contains(rf"(?:^|;)\s*{tag}\s*(?:;|$)", regex=True)
+        mask = mask + in_list.where(is_list, in_legacy).astype("uint8") * bit
+    return mask.astype("uint8")
 
 
 def append_entry(csv_path: Path, mood: int, note: str = "", tags: list[str] | None = None) -> None:
     ensure_data_store(csv_path)
     tags = tags or []
 
-    ts = datetime.now().replace(microsecond=0).isoformat() 
-    row = {
-        "timestamp": ts,
-        "mood": int(mood),
-        "note": (note or "").strip(),
-        "tags": json.dumps(tags, ensure_ascii=False),
-    }
-    df = load_dataframe(csv_path)
-    df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
-    df.to_csv(csv_path, index=False)
+    ts = time.strftime("%Y-%m-%dT%H:%M:%S")
+    # Append one line; the existing rows never need to be read back.
+    with csv_path.open("a", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator="\n").writerow([ts, int(mood), (note or "").strip(), json.dumps(tags, ensure_ascii=False)])
+    _CACHE.pop(csv_path, None)
@@ -2,6 +2,8 @@
 theme.py — ttk theme helpers for a cleaner, modern look with light/dark modes
 """
 from __future__ import annotations
+from collections import deque
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk
 
@@ -98,27 +100,27 @@ def style_text(text_widget: tk.Text) -> None:
 
 def restyle_descendants(widget: tk.Misc) -> None:
     """Walk the widget tree and restyle any raw Tk widgets (Text, etc.)."""
-
-    if isinstance(widget, tk.Text):
-        style_text(widget)
-
-    for child in widget.winfo_children():
-        restyle_descendants(child)
+    queue = deque([widget])
+    while queue:
+        w = queue.popleft()
+        if isinstance(w, tk.Text):
+            style_text(w)
+        queue.extend(w.winfo_children())
 
 
 def _clamp(n: int) -> int:
     return max(0, min(255, n))
 
 def _hex_to_rgb(h: str) -> tuple[int, int, int]:
-    h = h.lstrip("#")
-    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+    v = int(h.lstrip("#"), 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
 
 def _rgb_to_hex(rgb: tuple[int, int, int]) -> str:
-    return "#%02x%02x%02x" % rgb
+    r, g, b = rgb
+    return f"#{(r << 16) | (g << 8) | b:06x}"
 
+@lru_cache(maxsize=128)
 def _shade(hex_color: str, percent: int) -> str:
     r, g, b = _hex_to_rgb(hex_color)
-    r = _clamp(int(r * (100 + percent) / 100))
-    g = _clamp(int(g * (100 + percent) / 100))
-    b = _clamp(int(b * (100 + percent) / 100))
-    return _rgb_to_hex((r, g, b))
+    scale = 100 + percent
+    return _rgb_to_hex((_clamp(r * scale // 100), _clamp(g * scale // 100), _clamp(b * scale // 100)))